@@ -19,6 +19,7 @@ from langchain_core.vectorstores import InMemoryVectorStore
 from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
 from langchain_core.runnables import RunnableLambda, RunnablePassthrough
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
 import queue
@@ -235,10 +236,12 @@ import tiktoken
 
 maximum_nr_tokens_sql_query = 500
 
+# resolve the tokenizer once, so counting tokens does not look up the encoding on every call
+encoding = tiktoken.encoding_for_model("gpt-4o")
+
 # create a function that counts the tokens from a string
 def count_tokens(string:str):
  """ returns the number of tokens in a text string """
- encoding = tiktoken.encoding_for_model("gpt-4o")
  num_tokens = len(encoding.encode(string))
  return num_tokens
 
@@ -347,6 +350,20 @@ def correct_syntax_sql_query(sql_query: str, error:str, objects_documentation: s
  sql_query = result['query']
  return sql_query
 
+def run_sql_query(sql_query: str) -> str:
+  """ executes the sql query and returns its result as a string (or the error message) """
+  try:
+      results = execute_query(sql_query, db_path)
+
+      # empty result (None or no rows): return early without building a DataFrame
+      if not results:
+          return "No results found."
+
+      # Convert results to DataFrame for string representation
+      return pd.DataFrame(results).to_string(index=False, header=False)
+  except Exception as e:
+      return f"Error: {str(e)}"
+
 @tool
 def execute_sql_query(state:State):
   """ executes the sql query and retrieve the result """
@@ -363,16 +380,7 @@ def execute_sql_query(state:State):
        sql_query = state['current_sql_queries'][query_index]['query']
 
        # executes the query and if it throws an error, correct it (max 3x times) then execute it again.
-       try:
-           results = execute_query(sql_query, db_path)
-           if results is None or len(results) == 0:
-               sql_query_result = "No results found."
-           else:
-               # Convert results to DataFrame for string representation
-               sql_query_result_df = pd.DataFrame(results)
-               sql_query_result = sql_query_result_df.to_string(index=False, header=False)
-       except Exception as e:
-           sql_query_result = f"Error: {str(e)}"
+       sql_query_result = run_sql_query(sql_query)
 
        attempt = 0
        while 'Error' in sql_query_result and attempt < 3:
@@ -381,15 +389,7 @@ def execute_sql_query(state:State):
             # Update state with corrected query immediately
             state['current_sql_queries'][query_index]['query'] = sql_query
 
-            try:
-                results = execute_query(sql_query, db_path)
-                if results is None or len(results) == 0:
-                    sql_query_result = "No results found."
-                else:
-                    sql_query_result_df = pd.DataFrame(results)
-                    sql_query_result = sql_query_result_df.to_string(index=False, header=False)
-            except Exception as e:
-                sql_query_result = f"Error: {str(e)}"
+            sql_query_result = run_sql_query(sql_query)
 
             attempt += 1
 
@@ -867,12 +867,15 @@ def add_assumptions(state:State):
 
   key_assumptions = []
 
-  # Generate query explanations for each executed query
-  for query_data in state['current_sql_queries']:
-      if query_data.get('query'):
-          explanation = create_query_explanation(query_data['query'])
-          if explanation.get('explanation') and isinstance(explanation['explanation'], list):
-              key_assumptions.extend(explanation['explanation'])
+  # Generate query explanations for each executed query.
+  # The llm calls are independent of each other, so run them concurrently; map keeps the original query order.
+  executed_queries = [query_data['query'] for query_data in state['current_sql_queries'] if query_data.get('query')]
+  with ContextThreadPoolExecutor() as executor:
+      explanations = list(executor.map(create_query_explanation, executed_queries))
+
+  for explanation in explanations:
+      if explanation.get('explanation') and isinstance(explanation['explanation'], list):
+          key_assumptions.extend(explanation['explanation'])
 
   # Store in state
   state['generate_answer_details']['key_assumptions'] = key_assumptions
@@ -1011,21 +1014,28 @@ def run_control_flow(state:State):
 
 def add_key_terms_to_objects_documentation(base_documentation: str, key_terms: list) -> str:
     """Appends a Key Terms section to the base objects documentation."""
-    key_terms_text = "\nKey Terms:\n"
+    # no glossary configured: skip building an empty Key Terms section
+    if not key_terms:
+        return base_documentation
+
+    key_terms_lines = [base_documentation, "\nKey Terms:\n"]
     for term in key_terms:
         term_name = term.get('name', '')
         term_definition = term.get('definition', '')
         query_instructions = term.get('query_instructions', '')
 
         if term_definition:
-            key_terms_text += f"  - {term_name}: {term_definition}\n"
+            key_terms_lines.append(f"  - {term_name}: {term_definition}\n")
         else:
-            key_terms_text += f"  - {term_name}\n"
+            key_terms_lines.append(f"  - {term_name}\n")
 
         if query_instructions:
-            key_terms_text += f"    {query_instructions}\n"
+            key_terms_lines.append(f"    {query_instructions}\n")
+
+    return "".join(key_terms_lines)
 
-    return base_documentation + key_terms_text
+# the documentation and key terms are static for the lifetime of the process, so build the prompt-ready text once
+objects_documentation_with_key_terms = add_key_terms_to_objects_documentation(objects_documentation, key_terms)
 
 # function to reset the state current queries (to add in the start of graph execution)
 def reset_state(state:State):
@@ -1040,7 +1050,7 @@ def reset_state(state:State):
     state['analytical_intent'] = []
     state['scenario'] = ''
 
-    state['objects_documentation'] = add_key_terms_to_objects_documentation(objects_documentation, key_terms)
+    state['objects_documentation'] = objects_documentation_with_key_terms
 
     state['sql_dialect'] = sql_dialect
     return state
@@ -79,10 +79,13 @@ def create_config(run_name: str, is_new_thread_id: bool = False, thread_id: str
 
     return config, thread_id
 
+# libyaml's C loader parses the semantic model much faster; fall back to the pure-Python loader when it is not compiled in
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def _load_semantic_model():
     model_path = Path(__file__).parent / 'semantic_model.yaml'
     with open(model_path) as f:
-        model = yaml.safe_load(f)
+        model = yaml.load(f, Loader=_YamlLoader)
     return model['tables'], model['relationships'], model['key_terms']
 
 database_schema, table_relationships, key_terms = _load_semantic_model()
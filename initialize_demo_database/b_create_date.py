@@ -1,10 +1,9 @@
 import sqlite3
 import pandas as pd
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
-from typing import List, Dict, Any
+from typing import List, Tuple
 import os
-import calendar
 
 sqlite3.register_adapter(date, lambda val: val.isoformat())
 sqlite3.register_adapter(datetime, lambda val: val.isoformat())
@@ -33,104 +32,36 @@ class DateDimensionGenerator:
         # Quarter names
         self.quarter_names = ['Q1', 'Q2', 'Q3', 'Q4']
 
-    def _get_quarter(self, calendar_day: date) -> int:
-        """Get quarter number for a given date (1-4)."""
-        month = calendar_day.month
-        if month in [1, 2, 3]:
-            return 1
-        elif month in [4, 5, 6]:
-            return 2
-        elif month in [7, 8, 9]:
-            return 3
-        else:  # [10, 11, 12]
-            return 4
-
-    def _get_quarter_start_date(self, calendar_day: date) -> date:
-        """Get the start date of the quarter for a given date."""
-        quarter = self._get_quarter(calendar_day)
-        year = calendar_day.year
-
-        if quarter == 1:
-            return date(year, 1, 1)
-        elif quarter == 2:
-            return date(year, 4, 1)
-        elif quarter == 3:
-            return date(year, 7, 1)
-        else:  # quarter == 4
-            return date(year, 10, 1)
-
-    def _get_quarter_end_date(self, calendar_day: date) -> date:
-        """Get the end date of the quarter for a given date."""
-        quarter = self._get_quarter(calendar_day)
-        year = calendar_day.year
-
-        if quarter == 1:
-            return date(year, 3, 31)
-        elif quarter == 2:
-            return date(year, 6, 30)
-        elif quarter == 3:
-            return date(year, 9, 30)
-        else:  # quarter == 4
-            return date(year, 12, 31)
-
-    def _get_month_start_date(self, calendar_day: date) -> date:
-        """Get the start date of the month for a given date."""
-        return date(calendar_day.year, calendar_day.month, 1)
-
-    def _get_month_end_date(self, calendar_day: date) -> date:
-        """Get the end date of the month for a given date."""
-        last_day = calendar.monthrange(calendar_day.year, calendar_day.month)[1]
-        return date(calendar_day.year, calendar_day.month, last_day)
-
-    def _is_weekend(self, calendar_day: date) -> bool:
-        """Check if the date falls on a weekend (Saturday or Sunday)."""
-        return calendar_day.weekday() in [5, 6]  # Saturday=5, Sunday=6
-
-    def generate_date_dimension_data(self) -> List[Dict[str, Any]]:
-        """Generate date dimension data according to schema specifications."""
+    def generate_date_dimension_data(self) -> List[Tuple]:
+        """Generate date dimension data according to schema specifications.
+
+        All attributes are derived column-wise from a single daily DatetimeIndex,
+        instead of computing each day in a Python loop. Each record is a tuple
+        ordered like the columns of the date table.
+        """
         print(f"Generating date dimension from {self.start_date} to {self.end_date}...")
 
-        date_data = []
-        current = self.start_date
-        processed = 0
-
-        while current <= self.end_date:
-            if processed % 1000 == 0:
-                print(f"Generated {processed:,} date records...")
-
-            month_name = self.month_names[current.month - 1]
-            month = current.month
-            day_of_month = current.day
-            month_start_date = self._get_month_start_date(current)
-            month_end_date = self._get_month_end_date(current)
-
-            quarter = self._get_quarter(current)
-            quarter_name = self.quarter_names[quarter - 1]
-            quarter_start_date = self._get_quarter_start_date(current)
-            quarter_end_date = self._get_quarter_end_date(current)
-
-            year = current.year
-            is_weekend = self._is_weekend(current)
-
-            date_record = {
-                'calendar_day': current,
-                'month_name': month_name,
-                'month': month,
-                'day_of_month': day_of_month,
-                'month_start_date': month_start_date,
-                'month_end_date': month_end_date,
-                'quarter': quarter,
-                'quarter_name': quarter_name,
-                'quarter_start_date': quarter_start_date,
-                'quarter_end_date': quarter_end_date,
-                'year': year,
-                'is_weekend': is_weekend
-            }
-
-            date_data.append(date_record)
-
-            current += timedelta(days=1)
-            processed += 1
+        days = pd.date_range(self.start_date, self.end_date, freq='D')
+        month_periods = days.to_period('M')
+        quarter_periods = days.to_period('Q')
+
+        date_df = pd.DataFrame({
+            'calendar_day': days.date,
+            'month_name': pd.Index(self.month_names).take(days.month - 1),
+            'month': days.month,
+            'day_of_month': days.day,
+            'month_start_date': month_periods.start_time.date,
+            'month_end_date': month_periods.end_time.date,
+            'quarter': days.quarter,
+            'quarter_name': pd.Index(self.quarter_names).take(days.quarter - 1),
+            'quarter_start_date': quarter_periods.start_time.date,
+            'quarter_end_date': quarter_periods.end_time.date,
+            'year': days.year,
+            'is_weekend': days.dayofweek >= 5  # Saturday=5, Sunday=6
+        })
+
+        # itertuples yields native Python types for the sqlite3 adapters, without a dict per row
+        date_data = list(date_df.itertuples(index=False, name=None))
 
         print(f"Generated {len(date_data):,} date records")
         print(f"Date range: {self.start_date} to {self.end_date}")
@@ -191,7 +122,7 @@ class DateDimensionGenerator:
         finally:
             conn.close()
 
-    def insert_date_dimension_data(self, date_data: List[Dict[str, Any]], batch_size: int = 1000):
+    def insert_date_dimension_data(self, date_data: List[Tuple], batch_size: int = 1000):
         """Insert date dimension data into SQLite database."""
         print(f"Inserting {len(date_data):,} date records...")
 
@@ -199,15 +130,26 @@ class DateDimensionGenerator:
         INSERT INTO date (
             calendar_day, month_name, month, day_of_month, month_start_date, month_end_date,
             quarter, quarter_name, quarter_start_date, quarter_end_date, year, is_weekend
-        ) VALUES (
-            :calendar_day, :month_name, :month, :day_of_month, :month_start_date, :month_end_date,
-            :quarter, :quarter_name, :quarter_start_date, :quarter_end_date, :year, :is_weekend
-        )
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
 
         conn = sqlite3.connect(self.db_path)
         try:
             cursor = conn.cursor()
+
+            # Drop the secondary indexes for the bulk load and rebuild each one in a single pass afterwards,
+            # instead of updating every index row by row. Everything runs in one transaction, so a failed load
+            # rolls back to the original indexes. The primary key index (no sql in sqlite_master) is kept.
+            cursor.execute("""
+                SELECT name, sql FROM sqlite_master
+                WHERE type = 'index' AND tbl_name = 'date' AND sql IS NOT NULL
+            """)
+            index_definitions = cursor.fetchall()
+
+            cursor.execute("BEGIN")
+            for index_name, _ in index_definitions:
+                cursor.execute(f"DROP INDEX {index_name}")
+
             for i in range(0, len(date_data), batch_size):
                 batch = date_data[i:i + batch_size]
                 cursor.executemany(insert_sql, batch)
@@ -215,6 +157,9 @@ class DateDimensionGenerator:
                 if (i // batch_size + 1) % 10 == 0:
                     print(f"Inserted {min(i + batch_size, len(date_data)):,} records...")
 
+            for _, index_sql in index_definitions:
+                cursor.execute(index_sql)
+
             conn.commit()
             print(f"Successfully inserted all {len(date_data):,} date records")
         except Exception as e:
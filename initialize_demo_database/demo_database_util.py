@@ -56,37 +56,33 @@ def create_objects_documentation(database_schema, table_relationships, key_terms
         table_name = table['table_name']
         table_desc = table['table_description']
 
-        # Start with table info
-        table_text = f"Table {table_name}: {table_desc}\n"
-        table_text += "Columns:\n"
+        # Start with table info; collect lines and join once instead of growing a string with +=
+        table_lines = [f"Table {table_name}: {table_desc}\n", "Columns:\n"]
 
         # Add all columns for this table
         for column_name, column_info in table['columns'].items():
-            table_text += f"  - Column {column_name}: {column_info['description']}\n"
+            table_lines.append(f"  - Column {column_name}: {column_info['description']}\n")
 
             # Use pre-filled sample_values
             sample_values = column_info.get('sample_values')
             if sample_values:
-                table_text += f"    Sample values in column {column_name}: {sample_values}\n"
+                table_lines.append(f"    Sample values in column {column_name}: {sample_values}\n")
 
             # Use pre-filled date_range
             date_range = column_info.get('date_range', '').strip()
             if date_range:
                 date_range_entries.append(f"  - Table {table_name}, column {column_name}: {date_range}\n")
 
-        objects_documentation.append(table_text)
+        objects_documentation.append("".join(table_lines))
 
     # Add ALL table relationships
-    relationships_text = "\nRelationships between Tables:\n"
-    for rel in table_relationships:
-        relationships_text += f"  {rel['key1']} -> {rel['key2']}\n"
-    objects_documentation.append(relationships_text)
+    relationships_lines = ["\nRelationships between Tables:\n"]
+    relationships_lines.extend(f"  {rel['key1']} -> {rel['key2']}\n" for rel in table_relationships)
+    objects_documentation.append("".join(relationships_lines))
 
     # Add date range information
     if date_range_entries:
-        date_range = "\nImportant considerations about dates available:\n"
-        date_range += "".join(date_range_entries)
-        objects_documentation.append(date_range)
+        objects_documentation.append("\nImportant considerations about dates available:\n" + "".join(date_range_entries))
 
     # Join all parts
     return "\n".join(objects_documentation)